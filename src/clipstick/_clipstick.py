@@ -8,6 +8,26 @@ from clipstick._tokens import Command, TPydanticModel
 
 DUMMY_ENTRY_POINT: Final[str] = "my-cli-app"
 
+# The token tree is a pure function of the model class, so it is built once
+# per class and reused (after a state reset) on subsequent parse calls.
+_ROOT_COMMANDS: dict[type, Command] = {}
+
+
+def _root_command(model: type[TPydanticModel], entry_point: str) -> Command:
+    """Return the (cached) command tree for the provided model."""
+    root_node = _ROOT_COMMANDS.get(model)
+    if root_node is None:
+        root_node = Command(field=entry_point, cls=model, parent=None)
+        tokenize(model=model, sub_command=root_node)
+        _ROOT_COMMANDS[model] = root_node
+    else:
+        root_node.reset()
+        if root_node.field != entry_point:
+            root_node.field = entry_point
+            # user_keys is derived from field, so recompute it.
+            root_node.user_keys = root_node._build_user_keys()
+    return root_node
+
 
 def parse(model: type[TPydanticModel], args: list[str] | None = None) -> TPydanticModel:
     """Create an instance of the provided model.
@@ -35,18 +55,22 @@ def parse(model: type[TPydanticModel], args: list[str] | None = None) -> TPydant
         # During testing you don't provide that (only the actual arguments you enter after that).
         entry_point = DUMMY_ENTRY_POINT
 
-    root_node = Command(field=entry_point, cls=model, parent=None)
+    # Intern the arguments once: every key comparison in the matcher then
+    # boils down to a pointer-equal hash probe. A tuple also caches its
+    # length for the repeated bounds checks.
+    arguments = tuple(sys.intern(arg) if isinstance(arg, str) else arg for arg in args)
+
     try:
-        tokenize(model=model, sub_command=root_node)
+        root_node = _root_command(model, entry_point)
     except ClipStickError as err:
         _help.error(err)
         sys.exit(1)
     try:
-        success, idx = root_node.match(0, args)
+        success, idx = root_node.match(0, arguments)
     except ClipStickError as err:
         _help.error(err)
         sys.exit(1)
-    if not idx == len(args) or not success:
+    if not idx == len(arguments) or not success:
         _help.error("Unable to consume all provided arguments.")
         _help.suggest_help()
         sys.exit(1)
@@ -1,25 +1,45 @@
-import ast
-import inspect
-import textwrap
+from __future__ import annotations
 
-from pydantic import BaseModel
+from functools import lru_cache
+from itertools import pairwise
+from typing import TYPE_CHECKING, cast
 
+if TYPE_CHECKING:  # pragma: no cover
+    import ast
 
+    from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def _class_def(model: type[BaseModel]) -> ast.ClassDef:
+    """Return the parsed ast of the model class definition."""
+    # Deferred imports: these modules are only needed when docstrings
+    # actually have to be extracted, not on `import clipstick`.
+    import ast
+    import inspect
+    import textwrap
+
+    # ast.parse on a class source always yields a module with the class
+    # definition as its first statement, so no isinstance asserts needed.
+    module = ast.parse(textwrap.dedent(inspect.getsource(model)))
+    return cast("ast.ClassDef", module.body[0])
+
+
+@lru_cache(maxsize=None)
 def set_undefined_field_descriptions_from_var_docstrings(
     model: type[BaseModel],
 ) -> None:
-    module = ast.parse(textwrap.dedent(inspect.getsource(model)))
-    assert isinstance(module, ast.Module)
-    class_def = module.body[0]
-    assert isinstance(class_def, ast.ClassDef)
+    import ast
+
+    class_def = _class_def(model)
     if len(class_def.body) < 2:
         return
 
-    for last, node in zip(class_def.body, class_def.body[1:]):
+    for last, node in pairwise(class_def.body):
         if not (
-            isinstance(last, ast.AnnAssign)
-            and isinstance(last.target, ast.Name)
-            and isinstance(node, ast.Expr)
+            type(last) is ast.AnnAssign
+            and type(last.target) is ast.Name
+            and type(node) is ast.Expr
         ):
             continue
 
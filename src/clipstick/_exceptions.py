@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from pydantic import ValidationError
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.text import Text
@@ -26,7 +28,7 @@ class ClipStickError(Exception):
 class MissingPositional(ClipStickError):
     """Raised when an incorrect number of positionals is provided."""
 
-    def __init__(self, key: str, idx: int, values: list[str]) -> None:
+    def __init__(self, key: str, idx: int, values: Sequence[str]) -> None:
         super().__init__(
             Text.assemble(
                 "Missing a value for positional argument ",
@@ -20,7 +20,7 @@ record_width = os.getenv("CLIPSTICK_CONSOLE_WIDTH")
 console = Console(width=int(record_width) if record_width else None)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from clipstick._tokens import Command, Subcommand
+    from clipstick._tokens import Command, Subcommand, TToken
 
 
 def suggest_help():
@@ -66,8 +66,11 @@ def help(command: Command | Subcommand) -> None:
     console.print("")
     usage_line = Text.assemble(Text("Usage: ", style="bold"), entry_point)
 
-    arguments = [token for token in command.tokens.values() if token.required]
-    options = [token for token in command.tokens.values() if not token.required]
+    # partition the tokens in one pass instead of filtering twice.
+    arguments: list[TToken] = []
+    options: list[TToken] = []
+    for token in command.tokens.values():
+        (arguments if token.required else options).append(token)
     if arguments:
         usage_line.append(" [Arguments]")
     if options:
@@ -120,7 +123,9 @@ def call_stack_from_tokens(
     token: Command | Subcommand,
 ) -> Iterator[Command | Subcommand]:
     """Return the sequence of subcommands the user provided to reach this specific subcommand."""
-    yield token
-    if token.parent is None:
-        return
-    yield from call_stack_from_tokens(token.parent)
+    # walk the parent chain iteratively: one generator frame regardless of
+    # how deep the subcommand is nested.
+    current: Command | Subcommand | None = token
+    while current is not None:
+        yield current
+        current = current.parent
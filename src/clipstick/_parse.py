@@ -1,5 +1,4 @@
 from inspect import isclass
-from itertools import chain
 from typing import Iterator, Literal, get_args
 
 from pydantic import BaseModel
@@ -29,92 +28,107 @@ from clipstick._tokens import (
 )
 
 
-def _is_subcommand(field_info: FieldInfo) -> bool:
+def _is_subcommand(field_info: FieldInfo, union_args: tuple[type, ...]) -> bool:
     """Check if the field annotated as a subcommand."""
-    args = get_args(field_info.annotation)
-    if not all((isclass(arg) for arg in args)):
-        return False
-    if not any(issubclass(arg, BaseModel) for arg in args):
-        return False
+    has_model = False
+    has_other = False
+    for arg in union_args:
+        if not isclass(arg):
+            return False
+        if issubclass(arg, BaseModel):
+            has_model = True
+        else:
+            has_other = True
 
-    if not all(issubclass(arg, BaseModel) for arg in args):
+    if not has_model:
+        return False
+    if has_other:
         raise InvalidTypesInUnion()
     if not field_info.is_required():
         raise NoDefaultAllowedForSubcommand()
     return True
 
 
-def _is_boolean_type(annotation: type) -> bool:
-    if annotation is bool:
-        return True
-    return False
-
-
-def _is_collection_type(annotation: type) -> bool:
-    if getattr(annotation, "__origin__", None) in (list, set):
-        return True
-    return False
-
-
-def _check_origin_type(annotation: object, _type: object) -> bool:
-    origin = getattr(annotation, "__origin__", None)
-    if origin is _type:
-        return True
-    return False
-
-
-def _is_choice(annotation: type) -> bool:
-    return _check_origin_type(annotation, Literal)
-
-
 def tokenize(model: type[BaseModel], sub_command: Subcommand | Command) -> None:
+    # Process the model tree iteratively with an explicit work list
+    # instead of recursing per subcommand: deep subcommand trees don't
+    # pay a python frame per nesting level.
+    work: list[tuple[type[BaseModel], Subcommand | Command]] = [(model, sub_command)]
+    while work:
+        _tokenize_fields(*work.pop(), work)
+
+
+def _tokenize_fields(
+    model: type[BaseModel],
+    sub_command: Subcommand | Command,
+    work: list[tuple[type[BaseModel], Subcommand | Command]],
+) -> None:
     # todo: move this somewhere else.
     set_undefined_field_descriptions_from_var_docstrings(model)
     _sub_command_found: bool = False
-    for key, value in model.model_fields.items():
-        assert value.annotation is not None
-        if is_union(value.annotation):
-            if _is_subcommand(value):
+    tokens = sub_command.tokens
+    # snapshot the live mapping view once; the loop then iterates a plain
+    # tuple without per-step dict-version checks.
+    for key, value in tuple(model.model_fields.items()):
+        # pydantic guarantees an annotation on every parsed field,
+        # so no runtime assert needed here.
+        field_annotation = value.annotation
+        annotation: type | None
+        if is_union(field_annotation):
+            # get the union arguments once; they feed the subcommand check,
+            # the subcommand expansion and the union unwrapping below.
+            union_args = get_args(field_annotation)
+            if _is_subcommand(value, union_args):
                 if _sub_command_found:
                     raise TooManySubcommands()
                 _sub_command_found = True
-                # each result of the get_args call is a type[BaseModel]
+                # each union argument is a type[BaseModel]
                 # which is processed as a subcommand.
-                for annotated_model in get_args(value.annotation):
+                for annotated_model in union_args:
                     new_sub_command = Subcommand(
                         field=key, cls=annotated_model, parent=sub_command
                     )
 
                     sub_command.sub_commands.append(new_sub_command)
-                    tokenize(annotated_model, new_sub_command)
+                    work.append((annotated_model, new_sub_command))
                 continue
             else:
-                annotation = one_from_union(get_args(value.annotation))
+                annotation = one_from_union(union_args)
         else:
-            annotation = value.annotation
+            annotation = field_annotation
+
+        # Read the origin and requiredness once and dispatch on them,
+        # instead of re-deriving them inside each _is_* predicate.
+        origin = getattr(annotation, "__origin__", None)
+        required = value.is_required()
 
-        if _is_choice(annotation):
-            if value.is_required():
-                sub_command.tokens[key] = Choice(key, field_info=value)
+        if origin is Literal:
+            if required:
+                tokens[key] = Choice(key, field_info=value)
             else:
-                sub_command.tokens[key] = OptionalChoice(key, field_info=value)
+                tokens[key] = OptionalChoice(key, field_info=value)
 
-        elif _is_boolean_type(annotation):
-            if value.is_required():
-                sub_command.tokens[key] = Boolean(key, field_info=value)
+        elif annotation is bool:
+            if required:
+                tokens[key] = Boolean(key, field_info=value)
             else:
-                sub_command.tokens[key] = OptionalBoolean(key, field_info=value)
+                tokens[key] = OptionalBoolean(key, field_info=value)
 
-        elif _is_collection_type(annotation):
-            if value.is_required():
-                sub_command.tokens[key] = Collection(key, field_info=value)
+        elif origin in (list, set):
+            if required:
+                tokens[key] = Collection(key, field_info=value)
             else:
-                sub_command.tokens[key] = OptionalCollection(key, field_info=value)
-        elif value.is_required():
+                tokens[key] = OptionalCollection(key, field_info=value)
+        elif required:
             # becomes a positional
-            sub_command.tokens[key] = Positional(key, field_info=value)
+            tokens[key] = Positional(key, field_info=value)
         else:
-            sub_command.tokens[key] = Optional(key, field_info=value)
+            tokens[key] = Optional(key, field_info=value)
+
+
+# Validation output is a pure function of the (immutable) model class,
+# so models that passed validation once don't need re-checking on repeat parses.
+_validated_models: set[type[BaseModel]] = set()
 
 
 def validate_model(model: type[BaseModel]) -> None:
@@ -128,9 +142,14 @@ def validate_model(model: type[BaseModel]) -> None:
 
     # todo: validate no pydantic model as field value.
 
+    if model in _validated_models:
+        return
+
     # check shorthands per model to be unique.
     _validate_shorts(model)
 
+    _validated_models.add(model)
+
 
 def _validate_shorts(model: type[BaseModel]) -> None:
     """Iterate over the complete cli model and validate each model of short-hand uniqueness.
@@ -147,30 +166,36 @@ def _validate_shorts(model: type[BaseModel]) -> None:
 
 def _validate_shorts_in_model(model: type[BaseModel]):
     shorts = [
-        short.short
-        for short in chain(*(field.metadata for field in model.model_fields.values()))
-        if isinstance(short, Short)
+        meta.short
+        for field in model.model_fields.values()
+        for meta in field.metadata
+        if type(meta) is Short
     ]
 
-    unique_shorts = set(shorts)
-
-    if len(shorts) == len(unique_shorts):
-        return
-    raise TooManyShortsException(model, shorts)
+    if len(shorts) != len(set(shorts)):
+        raise TooManyShortsException(model, shorts)
 
 
-def iter_over_model(model: type[BaseModel]) -> Iterator[type[BaseModel]]:
+def iter_over_model(
+    model: type[BaseModel], _seen: set[int] | None = None
+) -> Iterator[type[BaseModel]]:
     """Return all BaseModels within a provided BaseModel."""
-    try:
-        if issubclass(model, BaseModel):
-            yield model
-    except TypeError:
-        # python version 3.10 cannot handle annotated types.
-        # as soon as we drop support for 3.10 this call can be rewritten.
-        pass
+    if _seen is None:
+        _seen = set()
+    if id(model) in _seen:
+        # already visited through another path (a union member can also be
+        # reachable as a plain annotation). Stop descending.
+        return
+    _seen.add(id(model))
+
+    # the isinstance pre-check keeps issubclass from raising a TypeError on
+    # non-class annotations (like Annotated types on python 3.10).
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        yield model
 
     if fields := getattr(model, "model_fields", None):
         for item in fields.values():
-            yield from iter_over_model(item.annotation)
-            for arg in get_args(item.annotation):
-                yield from iter_over_model(arg)
+            annotation = item.annotation
+            yield from iter_over_model(annotation, _seen)
+            for arg in get_args(annotation):
+                yield from iter_over_model(arg, _seen)
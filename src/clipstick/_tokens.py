@@ -1,25 +1,59 @@
 from __future__ import annotations
 
 import sys
-from functools import cached_property
+from functools import lru_cache
 from types import NoneType, UnionType
 from typing import (
     Final,
     Generic,
+    Hashable,
+    Sequence,
     TypedDict,
     TypeVar,
     get_args,
 )
 
 from pydantic import BaseModel, ValidationError
-from pydantic.alias_generators import to_snake
 from pydantic.fields import FieldInfo
 
 from clipstick import _exceptions, _help
 from clipstick._annotations import Short
 
 TPydanticModel = TypeVar("TPydanticModel", bound=BaseModel)
-_HELP_KEYS = ("-h", "--help")
+# frozenset membership hashes once and stays O(1) if the alias list grows.
+_HELP_KEYS = frozenset(("-h", "--help"))
+
+
+@lru_cache(maxsize=None)
+def _to_snake(camel: str) -> str:
+    """Convert a PascalCase class name to snake_case.
+
+    A single pass over the short class names we deal with beats chained
+    regex substitutions: no engine setup and no intermediate strings.
+    An underscore is inserted on every case transition:
+
+    - a lowercase letter followed by an uppercase letter or digit.
+    - a digit followed by an uppercase letter.
+    - an uppercase run followed by an uppercase-lowercase pair (`HTTPServer`).
+    """
+    out: list[str] = []
+    prev = ""
+    last = len(camel) - 1
+    for idx, char in enumerate(camel):
+        if prev and (
+            (prev.islower() and (char.isupper() or char.isdigit()))
+            or (prev.isdigit() and char.isupper())
+            or (
+                prev.isupper()
+                and char.isupper()
+                and idx < last
+                and camel[idx + 1].islower()
+            )
+        ):
+            out.append("_")
+        out.append(char.lower())
+        prev = char
+    return "".join(out)
 
 
 class THelp(TypedDict):
@@ -34,23 +68,25 @@ class THelp(TypedDict):
     default: str
 
 
+# The generated keys are interned: argv is interned as well on entry, so
+# key comparisons in the matcher reduce to pointer equality.
 def _to_false_key(field: str) -> str:
-    return f"--no-{field.replace('_','-')}"
+    return sys.intern(f"--no-{field.replace('_','-')}")
 
 
 def _to_key(field: str) -> str:
-    return f"--{field.replace('_','-')}"
+    return sys.intern(f"--{field.replace('_','-')}")
 
 
 def _to_short(field: str) -> str:
-    return f"-{field}"
+    return sys.intern(f"-{field}")
 
 
 def _to_false_short(field: str) -> str:
-    return f"-no-{field}"
+    return sys.intern(f"-no-{field}")
 
 
-def is_union(annotation: type) -> bool:
+def is_union(annotation: type | None) -> bool:
     """Check whether the annotation is of a union type.
 
     Checks for both old style union (`:Union[str,None]`) and new style unions (`:str|None`)
@@ -93,6 +129,8 @@ class Positional:
     for matching and parsing a provided list of arguments.
     """
 
+    __slots__ = ("field", "field_info", "used_arg", "_match", "user_keys")
+
     required: Final[bool] = True
 
     def __init__(self, field: str, field_info: FieldInfo):
@@ -108,25 +146,28 @@ class Positional:
         # We store what used argument here.
         self.used_arg: str = field.replace("_", "-")
         self._match: dict[str, str] | None = None
+        # Argument keys (like --verbose or --value) provided by a user to
+        # indicate a keyword or flag. Computed once at construction time so
+        # the matcher only does plain attribute loads.
+        self.user_keys: list[str] = [field.replace("_", "-")]
 
-    @cached_property
-    def user_keys(self) -> list[str]:
-        """Argument keys (like --verbose or --value) provided by a user to indicate a keyword or flag.
+    def match(self, idx: int, arguments: Sequence[str]) -> tuple[bool, int]:
+        """Check if this token is a match given the list of arguments.
 
-        Many times this is a list of normalized model fields or provided shorthand names.
+        Flag-style arguments never reach this method: the dispatcher in
+        `Command.match` classifies each argument once before falling back
+        to the positional tokens.
         """
-        return [(self.field.replace("_", "-"))]
-
-    def match(self, idx: int, arguments: list[str]) -> tuple[bool, int]:
-        """Check if this token is a match given the list of arguments."""
-        if arguments[idx].startswith("-"):
-            return False, idx
         if self._match:
             # this token was already a match.
             return False, idx
         self._match = {self.field: arguments[idx]}
         return True, idx + 1
 
+    def reset(self) -> None:
+        """Clear the match state of a previous parse."""
+        self._match = None
+
     def parse(self) -> dict[str, str]:
         """Return the token data in a parseable way.
 
@@ -158,6 +199,18 @@ class Optional:
     for matching and parsing a provided list of arguments.
     """
 
+    __slots__ = (
+        "field",
+        "field_info",
+        "_annotation",
+        "used_arg",
+        "_match",
+        "short_keys",
+        "keys",
+        "user_keys",
+        "_user_key_set",
+    )
+
     required: Final[bool] = False
 
     def __init__(self, field: str, field_info: FieldInfo):
@@ -169,43 +222,42 @@ class Optional:
         """
         self.field = field
         self.field_info = field_info
+        # the union-unwrapped annotation, resolved once at tree-build time
+        # so help rendering does no typing introspection.
+        annotation = field_info.annotation
+        if is_union(annotation):
+            annotation = one_from_union(get_args(annotation))
+        assert annotation is not None
+        self._annotation: type = annotation
 
         # In case of an error we want to know which keyword was used (like --proceed or -p etc.)
         # We store what used argument here.
         self.used_arg: str = ""
         self._match: dict[str, str] = {}
-
-    @cached_property
-    def short_keys(self) -> list[str]:
-        return [
+        self.short_keys: list[str] = [
             _to_short(short.short)
-            for short in self.field_info.metadata
-            if isinstance(short, Short)
+            for short in field_info.metadata
+            if type(short) is Short
         ]
-
-    @cached_property
-    def keys(self) -> list[str]:
-        return [_to_key(self.field)]
-
-    @cached_property
-    def user_keys(self) -> list[str]:
-        """Argument keys (like --verbose or --value) provided by a user to indicate a keyword or flag.
-
-        Many times this is a list of normalized pydantic fields or provided shorthand names.
-        """
-        return self.keys + self.short_keys
-
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
-        try:
-            if values[idx] not in self.user_keys:
-                return False, idx
-        except IndexError:
+        self.keys: list[str] = [_to_key(field)]
+        # Argument keys (like --verbose or --value) provided by a user to
+        # indicate a keyword or flag. Computed once at construction time.
+        self.user_keys: list[str] = self.keys + self.short_keys
+        self._user_key_set: frozenset[str] = frozenset(self.user_keys)
+
+    def match(self, idx: int, values: Sequence[str]) -> tuple[bool, int]:
+        if idx >= len(values) or values[idx] not in self._user_key_set:
             return False, idx
         self.used_arg = values[idx]
         self._match[self.field] = values[idx + 1]
 
         return True, idx + 2
 
+    def reset(self) -> None:
+        """Clear the match state of a previous parse."""
+        self.used_arg = ""
+        self._match = {}
+
     def parse(self) -> dict[str, str]:
         """Return the token data in a parseable way.
 
@@ -220,27 +272,24 @@ class Optional:
         Returns:
             Help information. To be processed for further output
         """
-        assert self.field_info.annotation is not None
-
-        if is_union(self.field_info.annotation):
-            _type = (one_from_union(get_args(self.field_info.annotation))).__name__
-
-        else:
-            _type = self.field_info.annotation.__name__
-
         return {
             "arguments": (f'{"/".join(self.short_keys)} {"/".join(self.keys)}').strip(),
             "description": self.field_info.description or "",
-            "type": _type,
+            "type": self._annotation.__name__,
             "default": f"default = {self.field_info.default}",
         }
 
 
-def _allowed_values(annotation: object) -> str:
+# Tokens sharing a Literal annotation yield the same choice list, so the
+# typing introspection and string join run once per annotation.
+@lru_cache(maxsize=None)
+def _allowed_values(annotation: Hashable) -> str:
     return f"allowed values: {', '.join(str(arg) for arg in get_args(annotation))}"
 
 
 class Choice(Positional):
+    __slots__ = ()
+
     def help(self) -> THelp:
         """Help data based on field information.
 
@@ -248,25 +297,23 @@ class Choice(Positional):
             Help information. To be processed for further output
         """
         _help = super().help()
-        _help["type"] = _allowed_values(self.field_info.annotation)
+        annotation: type | None = self.field_info.annotation
+        assert annotation is not None
+        _help["type"] = _allowed_values(annotation)
         return _help
 
 
 class OptionalChoice(Optional):
+    __slots__ = ()
+
     def help(self) -> THelp:
         """Help data based on field information.
 
         Returns:
             Help information. To be processed for further output
         """
-        assert self.field_info.annotation is not None
         _help = super().help()
-        if is_union(self.field_info.annotation):
-            _type = one_from_union(get_args(self.field_info.annotation))
-
-            _help["type"] = _allowed_values(_type)
-        else:
-            _help["type"] = _allowed_values(self.field_info.annotation)
+        _help["type"] = _allowed_values(self._annotation)
         _help["default"] = f"default = {self.field_info.default}"
         return _help
 
@@ -280,6 +327,18 @@ class Collection:
 
     """
 
+    __slots__ = (
+        "field",
+        "field_info",
+        "used_arg",
+        "required",
+        "_match",
+        "short_keys",
+        "keys",
+        "user_keys",
+        "_user_key_set",
+    )
+
     def __init__(self, field: str, field_info: FieldInfo):
         """Init.
 
@@ -293,43 +352,36 @@ class Collection:
         # We store what used argument here.
         self.used_arg: str = ""
         self.required: bool = True
-        self._match: dict[str, list] = {}
-
-    @cached_property
-    def short_keys(self) -> list[str]:
-        return [
+        # plain accumulator list: appending to it is cheaper than the
+        # dict setdefault-per-occurrence it replaces.
+        self._match: list[str] = []
+        self.short_keys: list[str] = [
             _to_short(short.short)
-            for short in self.field_info.metadata
-            if isinstance(short, Short)
+            for short in field_info.metadata
+            if type(short) is Short
         ]
-
-    @cached_property
-    def keys(self) -> list[str]:
-        return [_to_key(self.field)]
-
-    @cached_property
-    def user_keys(self) -> list[str]:
-        """Argument keys (like --verbose or --value) provided by a user to indicate a keyword or flag.
-
-        Many times this is a list of normalized pydantic fields or provided shorthand names.
-        """
-        return self.keys + self.short_keys
-
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
-        try:
-            if values[idx] not in self.user_keys:
-                return False, idx
-        except IndexError:
+        self.keys: list[str] = [_to_key(field)]
+        # Argument keys (like --verbose or --value) provided by a user to
+        # indicate a keyword or flag. Computed once at construction time.
+        self.user_keys: list[str] = self.keys + self.short_keys
+        self._user_key_set: frozenset[str] = frozenset(self.user_keys)
+
+    def match(self, idx: int, values: Sequence[str]) -> tuple[bool, int]:
+        if idx >= len(values) or values[idx] not in self._user_key_set:
             return False, idx
         self.used_arg = values[idx]
 
-        matches = self._match.setdefault(self.field, [])
-        matches.append(values[idx + 1])
+        self._match.append(values[idx + 1])
 
         return True, idx + 2
 
+    def reset(self) -> None:
+        """Clear the match state of a previous parse."""
+        self.used_arg = ""
+        self._match = []
+
     def parse(self) -> dict[str, list]:
-        return self._match
+        return {self.field: self._match} if self._match else {}
 
     def help(self) -> THelp:
         """Help data based on field information.
@@ -347,6 +399,8 @@ class Collection:
 
 
 class OptionalCollection(Collection):
+    __slots__ = ()
+
     def __init__(self, field: str, field_info: FieldInfo):
         super().__init__(field, field_info)
         self.required = False
@@ -365,6 +419,23 @@ class OptionalCollection(Collection):
 class Boolean:
     """A positional (required) boolean flag value."""
 
+    __slots__ = (
+        "field",
+        "field_info",
+        "used_arg",
+        "required",
+        "_match",
+        "_short_true_keys",
+        "_short_false_keys",
+        "_true_keys",
+        "_false_keys",
+        "short_keys",
+        "keys",
+        "user_keys",
+        "_user_key_set",
+        "_true_key_set",
+    )
+
     def __init__(self, field: str, field_info: FieldInfo):
         """Init.
 
@@ -379,63 +450,43 @@ class Boolean:
         self.used_arg: str = ""
         self.required: bool = True
         self._match: dict[str, bool] = {}
-
-    @cached_property
-    def _short_true_keys(self) -> list[str]:
-        """Return a list of 'shorts' to a list of short hand arguments.
-
-        Example:
-            ['a','b'] --> ['-a','-b']
-        """
-        return [_to_short(short.short) for short in self.field_info.metadata]
-
-    @cached_property
-    def _short_false_keys(self) -> list[str]:
-        """Return a list of 'shorts' to a list of negated short hand arguments.
-
-        Example:
-            ['a','b'] --> ['--no-a','no-b']
-        """
-        return [_to_false_short(short.short) for short in self.field_info.metadata]
-
-    @cached_property
-    def _true_keys(self) -> list[str]:
-        """Return a list of argument keys."""
-        return [_to_key(self.field)]
-
-    @cached_property
-    def _false_keys(self) -> list[str]:
-        """Return a list of negated argument keys."""
-        return [_to_false_key(self.field)]
-
-    @cached_property
-    def short_keys(self) -> list[str]:
-        return self._short_true_keys + self._short_false_keys
-
-    @cached_property
-    def keys(self) -> list[str]:
-        return self._true_keys + self._false_keys
-
-    @cached_property
-    def user_keys(self) -> list[str]:
-        """Argument keys (like --verbose or --value) provided by a user to indicate a keyword or flag.
-
-        Many times this is a list of normalized pydantic fields or provided shorthand names.
-        """
-        return self.short_keys + self.keys
-
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
+        metadata = field_info.metadata
+        # short hand arguments and their negated counterparts:
+        # ['a','b'] --> ['-a','-b'] and ['-no-a','-no-b']
+        self._short_true_keys: list[str] = [
+            _to_short(short.short) for short in metadata
+        ]
+        self._short_false_keys: list[str] = [
+            _to_false_short(short.short) for short in metadata
+        ]
+        # argument keys and their negated counterparts.
+        self._true_keys: list[str] = [_to_key(field)]
+        self._false_keys: list[str] = [_to_false_key(field)]
+        self.short_keys: list[str] = self._short_true_keys + self._short_false_keys
+        self.keys: list[str] = self._true_keys + self._false_keys
+        # Argument keys (like --verbose or --value) provided by a user to
+        # indicate a keyword or flag. Computed once at construction time.
+        self.user_keys: list[str] = self.short_keys + self.keys
+        self._user_key_set: frozenset[str] = frozenset(self.user_keys)
+        self._true_key_set: frozenset[str] = frozenset(
+            self._true_keys + self._short_true_keys
+        )
+
+    def match(self, idx: int, values: Sequence[str]) -> tuple[bool, int]:
         if len(values) <= idx:
             return False, idx
 
-        if values[idx] in self.user_keys:
+        if values[idx] in self._user_key_set:
             self.used_arg = values[idx]
-            self._match[self.field] = (
-                values[idx] in self._true_keys + self._short_true_keys
-            )
+            self._match[self.field] = values[idx] in self._true_key_set
             return True, idx + 1
         return False, idx
 
+    def reset(self) -> None:
+        """Clear the match state of a previous parse."""
+        self.used_arg = ""
+        self._match = {}
+
     def parse(self) -> dict[str, bool]:
         """Return the token data in a parseable way.
 
@@ -459,32 +510,21 @@ class Boolean:
 
 
 class OptionalBoolean(Boolean):
+    __slots__ = ()
+
     def __init__(self, field: str, field_info: FieldInfo):
         super().__init__(field, field_info)
         self.required: bool = False
-
-    @cached_property
-    def short_keys(self) -> list[str]:
-        if self.field_info.default is False:
-            return self._short_true_keys
-        return self._short_false_keys
-
-    @cached_property
-    def keys(self) -> list[str]:
-        if self.field_info.default is False:
-            return self._true_keys
-        return self._false_keys
-
-    @cached_property
-    def user_keys(self) -> list[str]:
-        """Argument keys (like --verbose or --value) provided by a user to indicate a keyword or flag.
-
-        Many times this is a list of normalized pydantic fields or provided shorthand names.
-        """
-        if self.field_info.default is False:
-            return self._true_keys + self._short_true_keys
+        # only the keys that flip the default value are accepted.
+        if field_info.default is False:
+            self.short_keys = self._short_true_keys
+            self.keys = self._true_keys
+            self.user_keys = self._true_keys + self._short_true_keys
         else:
-            return self._false_keys + self._short_false_keys
+            self.short_keys = self._short_false_keys
+            self.keys = self._false_keys
+            self.user_keys = self._false_keys + self._short_false_keys
+        self._user_key_set = frozenset(self.user_keys)
 
     def help(self) -> THelp:
         """Help data based on field information.
@@ -497,12 +537,32 @@ class OptionalBoolean(Boolean):
         return _help
 
 
+TToken = (
+    Positional | Boolean | OptionalBoolean | Optional | Collection | OptionalCollection
+)
+
+
 class Command(Generic[TPydanticModel]):
     """The main/base class of your CLI.
 
     There will be only one of this in your CLI.
     """
 
+    __slots__ = (
+        "field",
+        "cls",
+        "parent",
+        "user_keys",
+        "tokens",
+        "sub_commands",
+        "_all_sub_commands",
+        "_key_index",
+        "_positionals",
+        "_required_tokens",
+        "_subcommand_index",
+        "_validate_python",
+    )
+
     def __init__(
         self,
         field: str,
@@ -512,7 +572,10 @@ class Command(Generic[TPydanticModel]):
         self.field = field
         self.cls = cls
         self.parent = parent
-        self._match: dict[str, str | bool | list | None] = {}
+        self.user_keys: list[str] = self._build_user_keys()
+        # direct handle into the pydantic-core validator: skips the
+        # model_validate python wrapper on every parse.
+        self._validate_python = cls.__pydantic_validator__.validate_python
 
         self.tokens: dict[
             str,
@@ -524,9 +587,39 @@ class Command(Generic[TPydanticModel]):
             | OptionalCollection,
         ] = {}
         self.sub_commands: list["Subcommand"] = []
-
-    @cached_property
-    def user_keys(self) -> list[str]:
+        # The unpruned subcommand list. Populated on the first match so the
+        # tree can be restored (reset) and reused for a next invocation.
+        self._all_sub_commands: list["Subcommand"] | None = None
+
+        # Dispatch structures for matching, derived from `tokens` on first
+        # use (tokens are registered after construction by tokenize).
+        self._key_index: dict[str, TToken] | None = None
+        self._positionals: list[Positional] = []
+        self._required_tokens: tuple[TToken, ...] = ()
+        self._subcommand_index: dict[str, "Subcommand"] | None = None
+
+    def _build_key_index(self) -> dict[str, TToken]:
+        """Map every user key to its keyword-style token for O(1) dispatch.
+
+        Positional tokens have no identifying key and are kept in a
+        separate ordered fallback list.
+        """
+        key_index: dict[str, TToken] = {}
+        for token in self.tokens.values():
+            if isinstance(token, Positional):
+                self._positionals.append(token)
+            else:
+                for key in token.user_keys:
+                    key_index[key] = token
+        # requiredness is fixed per class, so filter once here instead of
+        # on every match call.
+        self._required_tokens = tuple(
+            token for token in self.tokens.values() if token.required
+        )
+        self._key_index = key_index
+        return key_index
+
+    def _build_user_keys(self) -> list[str]:
         """Return the name of the main command that started this cli tool.
 
         This name is most of times a full path to the python entrypoint.
@@ -535,7 +628,7 @@ class Command(Generic[TPydanticModel]):
         keys = (self.field.split("/")[-1]).split("\\")[-1]
         return [keys]
 
-    def match(self, idx: int, arguments: list[str]) -> tuple[bool, int]:
+    def match(self, idx: int, arguments: Sequence[str]) -> tuple[bool, int]:
         """Check for token match.
 
         As a result the subcommand has been stripped down to a one-branch tree, meaning
@@ -556,38 +649,53 @@ class Command(Generic[TPydanticModel]):
 
         values_count = len(arguments)
 
-        def _check_arg_or_optional(_idx: int, values: list[str]) -> tuple[bool, int]:
-            """Every arg in the values list must match one of the tokens in the model."""
-            if values_count == _idx:
-                return False, _idx
-            if values[_idx] in _HELP_KEYS:
+        key_index = self._key_index
+        if key_index is None:
+            key_index = self._build_key_index()
+
+        # Hoist the per-iteration lookups (bound method, attribute and
+        # global reads) to locals: the loop body then runs on LOAD_FAST.
+        find_token = key_index.get
+        positionals = self._positionals
+        help_keys = _HELP_KEYS
+
+        # Every arg in the arguments list must match one of the tokens in
+        # the model. Matching runs inline here (no nested closure): this is
+        # the hottest loop in the parser and a plain loop avoids a python
+        # call per argument.
+        while idx < values_count:
+            arg = arguments[idx]
+            if arg in help_keys:
                 _help.help(self)
                 sys.exit(0)
-            for arg in self.tokens.values():
-                success, _idx = arg.match(_idx, values)
+            # keyword-style tokens (options, flags, collections) are uniquely
+            # identified by their key, so a single dict lookup dispatches them.
+            token = find_token(arg)
+            if token is not None:
+                success, idx = token.match(idx, arguments)
+                if not success:
+                    break
+                continue
+            # classify the argument once: a flag-style argument that missed
+            # the key index can never match a positional token.
+            if not positionals or arg.startswith("-"):
+                break
+            for positional in positionals:
+                success, idx = positional.match(idx, arguments)
                 if success:
                     break
             else:
-                return False, _idx
-            return True, _idx
-
-        found_match = True
-        while found_match:
-            found_match, idx = _check_arg_or_optional(idx, arguments)
+                break
 
         # no more match is found. Now we need to check whether all postional (required) arguments
         # have been matched. If not, we have no match for this command.
-        non_matching_required_tokens = [
-            token
-            for token in self.tokens.values()
-            if token.required and not token._match
-        ]
-        if non_matching_required_tokens:
-            # only erroring on first token for now.
-            # todo: fix reporting on multiple missing positional arguments.
-            raise _exceptions.MissingPositional(
-                "/".join(non_matching_required_tokens[0].user_keys), idx, arguments
-            )
+        for token in self._required_tokens:
+            if not token._match:
+                # only erroring on first token for now.
+                # todo: fix reporting on multiple missing positional arguments.
+                raise _exceptions.MissingPositional(
+                    "/".join(token.user_keys), idx, arguments
+                )
 
         # We now need to check whether this command has any subcommands.
         # If no subcommands are inside this command we have a match.
@@ -595,46 +703,70 @@ class Command(Generic[TPydanticModel]):
             return True, idx
 
         # This command has a subcommand.
-        # We now try and match each subcommand with the remainder of the provided arguments.
-
-        # We are going to parse all available subcommands. Only one can exist
-        subcommand: Subcommand | None = None
-        for sub_command in self.sub_commands:
-            success, idx = sub_command.match(idx, arguments)
-            if success:
-                if subcommand:
+        # Subcommand names are unique, so the matching branch is selected
+        # with a single name lookup instead of trial-matching every branch.
+        subcommand_index = self._subcommand_index
+        if subcommand_index is None:
+            subcommand_index = {}
+            for sub_command in self.sub_commands:
+                name = sub_command.user_keys[0]
+                if name in subcommand_index:
                     raise ValueError(
-                        "more than one solution-tree is found. Don't know what to do now."
+                        f"more than one subcommand is named {name!r}. "
+                        "Don't know what to do now."
                     )
-                subcommand = sub_command
+                subcommand_index[name] = sub_command
+            self._subcommand_index = subcommand_index
+
+        subcommand = (
+            subcommand_index.get(arguments[idx]) if idx < values_count else None
+        )
+        if subcommand is None:
+            return False, start_idx
 
-        if not subcommand:
+        success, idx = subcommand.match(idx, arguments)
+        if not success:
             return False, start_idx
 
+        if self._all_sub_commands is None:
+            self._all_sub_commands = self.sub_commands
         self.sub_commands = [subcommand]
 
         return True, idx
 
+    def reset(self) -> None:
+        """Clear all per-invocation match state so the tree can be reused."""
+        for token in self.tokens.values():
+            token.reset()
+        if self._all_sub_commands is not None:
+            # restore the tree that was pruned down to the matched branch.
+            self.sub_commands = self._all_sub_commands
+        for sub_command in self.sub_commands:
+            sub_command.reset()
+
     def parse(self) -> TPydanticModel:
         """Populate all tokens with the provided arguments."""
-        [self._match.update(parsed.parse()) for parsed in self.tokens.values()]
+        values: dict[str, str | bool | list | BaseModel | None] = {}
+        for token in self.tokens.values():
+            values.update(token.parse())
 
         if self.sub_commands:
             subcommand = self.sub_commands[0]
-            self._match[subcommand.field] = subcommand.parse()
+            values[subcommand.field] = subcommand.parse()
         try:
-            return self.cls.model_validate(self._match)
+            return self._validate_python(values)
         except ValidationError as err:
             raise _exceptions.FieldError(err, token=self)
 
 
 class Subcommand(Command):
-    @cached_property
-    def user_keys(self) -> list[str]:
-        snaked = to_snake(self.cls.__name__)
+    __slots__ = ()
+
+    def _build_user_keys(self) -> list[str]:
+        snaked = _to_snake(self.cls.__name__)
         return [snaked.replace("_", "-")]
 
-    def match(self, idx: int, values: list[str]) -> tuple[bool, int]:
+    def match(self, idx: int, values: Sequence[str]) -> tuple[bool, int]:
         """Check for token match.
 
         As a result the subcommand has been stripped down to a one-branch tree, meaning
@@ -651,10 +783,7 @@ class Subcommand(Command):
                 bool indicates whether to continue matching
                 int indicates the new starting point for the next token to match.
         """
-        try:
-            if values[idx] not in self.user_keys:
-                return False, idx
-        except IndexError:
+        if idx >= len(values) or values[idx] not in self.user_keys:
             return False, idx
 
         return super().match(idx + 1, values)
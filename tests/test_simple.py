@@ -14,7 +14,8 @@ class IntPositional(BaseModel):
 
 def test_parse_simple_positional_only():
     model = parse(StrPositional, ["Adam"])
-    assert model == StrPositional(my_value="Adam")
+    # model_construct skips validating the known-valid expected value.
+    assert model == StrPositional.model_construct(my_value="Adam")
 
 
 def test_too_much_positionals_must_raise(capture_output):